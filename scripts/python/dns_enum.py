@@ -1,15 +1,38 @@
 #!/usr/bin/env python3
 
-import dns.resolver
+import asyncio
+import sys
+
+import dns.asyncresolver
 
 domain = "example.com"
 records = ["A", "AAAA", "MX", "NS", "TXT"]
 
-for record in records:
+
+async def query(resolver, record):
     try:
-        answers = dns.resolver.resolve(domain, record)
-        print(f"\n{record} Records for {domain}:")
-        for rdata in answers:
-            print(rdata.to_text())
+        answers = await resolver.resolve(domain, record)
+        return record, answers, None
     except Exception as e:
-        print(f"{record} record query failed: {e}")
+        return record, None, e
+
+
+async def gather_records():
+    # One resolver shared by every task, so the system config is only read once
+    resolver = dns.asyncresolver.Resolver()
+    return await asyncio.gather(*(query(resolver, record) for record in records))
+
+
+def main():
+    blocks = []
+    for record, answers, error in asyncio.run(gather_records()):
+        if error is not None:
+            blocks.append(f"{record} record query failed: {error}\n")
+            continue
+        lines = "\n".join(rdata.to_text() for rdata in answers)
+        blocks.append(f"\n{record} Records for {domain}:\n{lines}\n")
+    sys.stdout.write("".join(blocks))
+
+
+if __name__ == "__main__":
+    main()